@@ -26,6 +26,8 @@ def main() -> None:
         host=config.SERVER_HOST,
         port=config.SERVER_PORT,
         reload=config.RELOAD,
+        loop=config.SERVER_LOOP,
+        http=config.SERVER_HTTP,
         log_level=config.LOGGING_LEVEL.lower(),
     )
 
@@ -11,6 +11,8 @@ from meta_aggregation_api.config.logger import LoggerConfig
 class Config(APMConfig, LoggerConfig, AuthConfig, CacheConfig, BaseSettings):
     SERVER_HOST: str = 'localhost'
     SERVER_PORT: int = 8000
+    SERVER_LOOP: str = 'uvloop'  # asyncio event loop implementation for uvicorn
+    SERVER_HTTP: str = 'httptools'  # HTTP/1.1 protocol implementation for uvicorn
     RELOAD: bool = True
     NATIVE_TOKEN_ADDRESS = '0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee'
     VERSION = '0.0.1'
@@ -23,6 +25,10 @@ class Config(APMConfig, LoggerConfig, AuthConfig, CacheConfig, BaseSettings):
     CORS_METHODS = ['*']
     CORS_HEADERS = ['*']
     WORKERS_COUNT: int = 1
+    RAW_SWAP_ROUTES: bool = False  # serve /price without FastAPI request parsing. Enable in prod
+    HTTP_POOL_LIMIT: int = 500  # max simultaneous connections to providers' APIs
+    HTTP_POOL_LIMIT_PER_HOST: int = 100
+    HTTP_DNS_CACHE_TTL: int = 300
     PARTNER: str = 'dex.guru'
     X_SYS_KEY: str = ''
     ONE_INCH_API_KEY: str = ''
@@ -1,11 +1,78 @@
+from math import inf
+from time import time
+from typing import Optional
+
+import jwt
+from fastapi import WebSocket
 from fastapi_jwt_auth import AuthJWT
 from pydantic import BaseSettings
 
 
 class AuthConfig(BaseSettings):
     authjwt_secret_key: str = 'secretkey'
+    VERIFIED_JWT_CACHE_SIZE: int = 10000
+    VERIFIED_JWT_CACHE_TTL_SEC: int = 300
 
 
 @AuthJWT.load_config
 def get_config():
     return AuthConfig()
+
+
+class CachedAuthJWT(AuthJWT):
+    """
+    AuthJWT which remembers access tokens from headers verified by jwt_required,
+    so repeated requests with the same token skip signature verification.
+    Token is kept until its exp claim, but not longer than VERIFIED_JWT_CACHE_TTL_SEC.
+    """
+
+    _verified_tokens: dict[str, float] = {}  # {raw token: expiration timestamp}
+    _auth_config = AuthConfig()
+
+    def jwt_required(
+        self,
+        auth_from: str = 'request',
+        token: Optional[str] = None,
+        websocket: Optional[WebSocket] = None,
+        csrf_token: Optional[str] = None,
+    ) -> None:
+        if (
+            auth_from != 'request'
+            or not self._token
+            or not self.jwt_in_headers
+            or self._denylist_enabled
+        ):
+            return super().jwt_required(auth_from, token, websocket, csrf_token)
+
+        now = time()
+        expires_at = self._verified_tokens.get(self._token)
+        if expires_at is not None and expires_at > now:
+            return
+        super().jwt_required(auth_from, token, websocket, csrf_token)
+
+        # signature is already verified above, only exp claim is read here
+        claims = jwt.decode(
+            self._token,
+            options={'verify_signature': False},
+            algorithms=self._decode_algorithms or [self._algorithm],
+        )
+        self._remember_token(
+            self._token,
+            min(
+                claims.get('exp', inf),
+                now + self._auth_config.VERIFIED_JWT_CACHE_TTL_SEC,
+            ),
+        )
+
+    @classmethod
+    def clear_verified_tokens(cls):
+        cls._verified_tokens.clear()
+
+    @classmethod
+    def _remember_token(cls, token: str, expires_at: float):
+        tokens = cls._verified_tokens
+        tokens.pop(token, None)
+        while tokens and len(tokens) >= cls._auth_config.VERIFIED_JWT_CACHE_SIZE:
+            # dict keeps insertion order, so the first token is the oldest one
+            del tokens[next(iter(tokens))]
+        tokens[token] = expires_at
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +27,29 @@ class MetaPriceModel(BaseModel):
     approve_cost: int = 0  # 0 for requests without taker_address. Cost of approve transaction for the provider
 
 
+class SwapPrices(BaseModel):
+    best_provider: Optional[str] = None  # name of the best provider. None if no prices found
+    prices: Dict[str, ProviderPriceResponse] = {}  # {provider: price_response}
+    approve_costs: Dict[str, int] = {}  # {provider: approve cost}
+
+    def best_quote(self) -> Optional[MetaPriceModel]:
+        if self.best_provider is None:
+            return None
+        return self._quote(self.best_provider)
+
+    def quotes(self) -> List[MetaPriceModel]:
+        return [self._quote(provider) for provider in self.prices]
+
+    def _quote(self, provider: str) -> MetaPriceModel:
+        return MetaPriceModel.construct(
+            provider=provider,
+            is_allowed=self.approve_costs[provider] == 0,
+            price_response=self.prices[provider],
+            is_best=provider == self.best_provider,
+            approve_cost=self.approve_costs[provider],
+        )
+
+
 class ProviderQuoteResponse(BaseModel):
     sources: list  # list of liquidity sources for the swap
     buy_amount: str  # amount of buy_token to buy
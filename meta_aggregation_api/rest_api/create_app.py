@@ -23,7 +23,11 @@ from meta_aggregation_api.rest_api.routes.gas import gas_routes
 from meta_aggregation_api.rest_api.routes.info import info_route
 from meta_aggregation_api.rest_api.routes.limit_orders import limit_orders
 from meta_aggregation_api.rest_api.routes.rpc import v1_rpc
-from meta_aggregation_api.rest_api.routes.swap import swap_route
+from meta_aggregation_api.rest_api.routes.swap import (
+    PricePayloads,
+    raw_swap_routes,
+    swap_route,
+)
 from meta_aggregation_api.rest_api.routes.crosschain_swap import crosschain_swap_route
 from meta_aggregation_api.utils.errors import (BaseAggregationProviderError,
                                                InternalError)
@@ -50,7 +54,15 @@ def create_app(config: Config):
     # Setup and register dependencies.
     apm_client = ApmClient(config)
     app.apm_client = apm_client
+    # One keep-alive pool shared by all providers and services,
+    # so TCP and TLS connections to providers' APIs are reused between requests.
     aiohttp_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=config.HTTP_POOL_LIMIT,
+            limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=config.HTTP_DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        ),
         trust_env=True,
         headers={'x-sys-key': config.X_SYS_KEY},
     )
@@ -138,11 +150,12 @@ def create_app(config: Config):
         providers=providers,
     )
     deps.register(app)
+    PricePayloads(config).register(app)
 
     # Setup and register middlewares and routes.
     register_cors(app, config)
     register_gzip(app)
-    register_route(app)
+    register_route(app, config)
     register_route_logging(app)
     if config.APM_ENABLED:
         register_elastic_apm(app, apm_client)
@@ -237,7 +250,10 @@ def register_elastic_apm(app: FastAPI, apm_client: ApmClient):
     app.add_middleware(ElasticAPM, client=apm_client.client)
 
 
-def register_route(app: FastAPI):
+def register_route(app: FastAPI, config: Config):
+    if config.RAW_SWAP_ROUTES:
+        # Registered first, so they take priority over the same FastAPI swap routes.
+        app.router.routes.extend(raw_swap_routes('/v1/market'))
     app.include_router(v1_rpc, prefix="/v1", tags=["RPC Requests"])
     app.include_router(gas_routes, prefix="/v1/gas", tags=["Gas"])
     app.include_router(info_route, prefix="/v1/info", tags=["Info"])
@@ -2,9 +2,8 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.security import HTTPBearer
-from pydantic import conint
 
-from meta_aggregation_api.config.auth import AuthJWT
+from meta_aggregation_api.config.auth import CachedAuthJWT
 from meta_aggregation_api.models.meta_agg_models import (
     MetaPriceModel,
     ProviderQuoteResponse,
@@ -23,7 +22,7 @@ crosschain_swap_route = APIRouter()
 async def get_swap_price(
     buy_token: address_to_lower = Query(..., alias='buyToken'),
     sell_token: address_to_lower = Query(..., alias='sellToken'),
-    sell_amount: conint(gt=0) = Query(..., alias='sellAmount'),
+    sell_amount: int = Query(..., gt=0, alias='sellAmount'),
     chain_id_from: int = Query(..., alias='chainIdFrom'),
     chain_id_to: int = Query(..., alias='chainIdTo'),
     gas_price: Optional[int] = Query(
@@ -88,10 +87,10 @@ async def get_swap_price(
     dependencies=[Depends(HTTPBearer())],
 )
 async def get_swap_quote(
-    authorize: AuthJWT = Depends(),
+    authorize: CachedAuthJWT = Depends(),
     buy_token: address_to_lower = Query(..., alias='buyToken'),
     sell_token: address_to_lower = Query(..., alias='sellToken'),
-    sell_amount: conint(gt=0) = Query(..., alias='sellAmount'),
+    sell_amount: int = Query(..., gt=0, alias='sellAmount'),
     chain_id_from: int = Query(..., alias='chainIdFrom'),
     chain_id_to: int = Query(..., alias='chainIdTo'),
     provider: str = Query(..., alias='provider'),
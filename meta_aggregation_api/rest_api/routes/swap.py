@@ -1,30 +1,167 @@
-from typing import List, Optional
+from functools import partial
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, Path, Query, HTTPException
+from aiocache import cached
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Path, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
-from pydantic import conint
+from pydantic import errors
+from pydantic.error_wrappers import ErrorWrapper
+from starlette.routing import Route
 
-from meta_aggregation_api.config.auth import AuthJWT
+from meta_aggregation_api.config import Config
+from meta_aggregation_api.config.auth import CachedAuthJWT
 from meta_aggregation_api.models.meta_agg_models import (
     MetaPriceModel,
     ProviderQuoteResponse,
 )
 from meta_aggregation_api.rest_api import dependencies
+from meta_aggregation_api.services.meta_aggregation_service import (
+    MetaAggregationService,
+)
+from meta_aggregation_api.utils.cache import (
+    coalesce_calls,
+    get_cache_config,
+    key_from_kwargs,
+)
 from meta_aggregation_api.utils.common import address_to_lower
 from meta_aggregation_api.utils.errors import responses
 
 PRICE_CACHE_TTL_SEC = 5
-swap_route = APIRouter()
+PRICE_CACHE_KEY_PARAMS = (
+    'chain_id',
+    'buy_token',
+    'sell_token',
+    'sell_amount',
+    'gas_price',
+    'slippage_percentage',
+    'taker_address',
+    'fee_recipient',
+    'buy_token_percentage_fee',
+    'provider',
+)
+# OpenAPI responses are built once here: errors from utils.errors are plain descriptions
+# and success models are only used for the schema, as routes don't set response_model.
+PRICE_RESPONSES = {**responses, 200: {'model': MetaPriceModel}}
+ALL_PRICES_RESPONSES = {**responses, 200: {'model': List[MetaPriceModel]}}
+QUOTE_RESPONSES = {**responses, 200: {'model': ProviderQuoteResponse}}
+swap_route = APIRouter(default_response_class=ORJSONResponse)
+
+PRICE_DESCRIPTION = """
+Price endpoints are used to get the best price for a swap. It does not return data for swap and therefore
+require any approvals. If you want to get data for swap, use /price_response endpoint.
+
+- **buy_token**: Address of the token to buy
+- **sell_token**: Address of the token to sell
+- **sell_amount**: Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
+- **chain_id**: Chain ID. See /info for supported chains
+- **gas_price**: Gas price in wei (optional)
+- **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
+- **taker_address**: Address of the taker (optional)
+- **fee_recipient**: Address of the fee recipient (optional)
+- **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
+- **provider**: Provider name from /info (optional). If not specified, the best price will be returned
+"""
+
+ALL_PRICES_DESCRIPTION = """
+Works the same as /price endpoint, but returns all prices from all supported providers.
+
+- **buy_token**: Address of the token to buy
+- **sell_token**: Address of the token to sell
+- **sell_amount**: Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
+- **chain_id**: Chain ID. See /info for supported chains
+- **gas_price**: Gas price in wei (optional)
+- **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
+- **taker_address**: Address of the taker (optional)
+- **fee_recipient**: Address of the fee recipient (optional)
+- **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
+"""
+
+QUOTE_DESCRIPTION = """
+Returns a data for swap from a specific provider.
+
+- **buy_token**:Address of the token to buy
+- **sell_token**:Address of the token to sell
+- **sell_amount**:Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
+- **chain_id**: Chain ID. See /info for supported chains
+- **provider**: Provider name from /info
+- **gas_price**: Gas price in wei (optional)
+- **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
+- **taker_address**: Address of the taker (optional)
+- **fee_recipient**: Address of the fee recipient (optional)
+- **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
+"""
+
+
+price_coalesced = partial(
+    coalesce_calls, key_builder=key_from_kwargs(*PRICE_CACHE_KEY_PARAMS)
+)
+
+
+class PricePayloads:
+    """
+    Cached response payloads of the price routes.
+    Built once per app from its config, so all requests share the same cache.
+    This is the only cache layer for prices, the service doesn't cache them.
+    """
+
+    def __init__(self, config: Config):
+        price_cached = partial(
+            cached,
+            ttl=PRICE_CACHE_TTL_SEC,
+            **{
+                **get_cache_config(config),
+                'key_builder': key_from_kwargs(*PRICE_CACHE_KEY_PARAMS),
+            },
+        )
+        # Concurrent callers share the payload, but each of them builds its own response
+        self.get_price = price_cached()(price_coalesced()(self.get_price))
+        self.get_all_prices = price_cached()(price_coalesced()(self.get_all_prices))
+
+    def register(self, app: FastAPI):
+        """
+        Registers itself in the application.
+        """
+        app.state.price_payloads = self
+
+    @staticmethod
+    async def get_price(
+        meta_aggregation_service: MetaAggregationService,
+        provider: Optional[str] = None,
+        **params,
+    ) -> Optional[dict]:
+        if provider:
+            res = await meta_aggregation_service.get_provider_price(
+                provider=provider, **params
+            )
+        else:
+            res = await meta_aggregation_service.get_best_swap_meta_price(**params)
+        return res.dict() if res else None
+
+    @staticmethod
+    async def get_all_prices(
+        meta_aggregation_service: MetaAggregationService, **params
+    ) -> Optional[list]:
+        res = await meta_aggregation_service.get_swap_meta_price(**params)
+        return [quote.dict() for quote in res] if res else None
+
+
+def price_payloads(request: Request) -> PricePayloads:
+    return request.app.state.price_payloads
 
 
-@swap_route.get('/{chain_id}/price', response_model=MetaPriceModel, responses=responses)
 @swap_route.get(
-    '/{chain_id}/price/', response_model=MetaPriceModel, include_in_schema=False
+    '/{chain_id}/price',
+    responses=PRICE_RESPONSES,
+    description=PRICE_DESCRIPTION,
 )
+@swap_route.get('/{chain_id}/price/', include_in_schema=False)
 async def get_swap_price(
+    request: Request,
     buy_token: address_to_lower = Query(..., alias='buyToken'),
     sell_token: address_to_lower = Query(..., alias='sellToken'),
-    sell_amount: conint(gt=0) = Query(..., alias='sellAmount'),
+    sell_amount: int = Query(..., gt=0, alias='sellAmount'),
     chain_id: int = Path(..., description='Chain ID'),
     gas_price: Optional[int] = Query(
         None, description='Gas price', gt=0, alias='gasPrice'
@@ -38,25 +175,8 @@ async def get_swap_price(
         None, alias='buyTokenPercentageFee'
     ),
     provider: Optional[str] = Query(None, alias='provider'),
-    meta_aggregation_service: dependencies.MetaAggregationService = Depends(
-        dependencies.meta_aggregation_service
-    ),
-) -> MetaPriceModel:
-    """
-    Price endpoints are used to get the best price for a swap. It does not return data for swap and therefore
-    require any approvals. If you want to get data for swap, use /price_response endpoint.
-
-    - **buy_token**: Address of the token to buy
-    - **sell_token**: Address of the token to sell
-    - **sell_amount**: Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
-    - **chain_id**: Chain ID. See /info for supported chains
-    - **gas_price**: Gas price in wei (optional)
-    - **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
-    - **taker_address**: Address of the taker (optional)
-    - **fee_recipient**: Address of the fee recipient (optional)
-    - **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
-    - **provider**: Provider name from /info (optional). If not specified, the best price will be returned
-    """
+) -> ORJSONResponse:
+    meta_aggregation_service = dependencies.meta_aggregation_service(request)
     params = {
         "buy_token": buy_token,
         "sell_token": sell_token,
@@ -68,38 +188,129 @@ async def get_swap_price(
         "fee_recipient": fee_recipient,
         "buy_token_percentage_fee": buy_token_percentage_fee,
     }
-    if provider:
-        res = await meta_aggregation_service.get_provider_price(
-            provider=provider, **params
-        )
-        if not res:
-            raise HTTPException(
-                status_code=404,
-                detail='No prices found',
-            )
-        return res
-    else:
-        res = await meta_aggregation_service.get_swap_meta_price(**params)
-    if not res:
+    content = await price_payloads(request).get_price(
+        meta_aggregation_service, provider=provider, **params
+    )
+    if content is None:
         raise HTTPException(
             status_code=404,
             detail='No prices found',
         )
-    return next((quote for quote in res if quote.is_best), None)
+    return ORJSONResponse(content=content)
+
+
+class RawQueryParam(NamedTuple):
+    name: str  # handler argument name
+    alias: str  # query parameter name
+    cast: Callable[[str], Any]  # raises pydantic errors, so 422 matches FastAPI ones
+    default: Any = None
+    required: bool = False
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise errors.IntegerError()
+
+
+def _positive_int(value: str) -> int:
+    value = _int(value)
+    if value <= 0:
+        raise errors.NumberNotGtError(limit_value=0)
+    return value
+
+
+def _float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise errors.FloatError()
+
+
+# Query params of get_swap_price in the order of its signature.
+# Must be kept in sync with it, the tests check that they match.
+RAW_PRICE_QUERY_PARAMS = (
+    RawQueryParam('buy_token', 'buyToken', address_to_lower.validate, required=True),
+    RawQueryParam('sell_token', 'sellToken', address_to_lower.validate, required=True),
+    RawQueryParam('sell_amount', 'sellAmount', _positive_int, required=True),
+    RawQueryParam('gas_price', 'gasPrice', _positive_int),
+    RawQueryParam('slippage_percentage', 'slippagePercentage', _float, 0.005),
+    RawQueryParam('taker_address', 'takerAddress', address_to_lower.validate),
+    RawQueryParam('fee_recipient', 'feeRecipient', address_to_lower.validate),
+    RawQueryParam('buy_token_percentage_fee', 'buyTokenPercentageFee', _float),
+    RawQueryParam('provider', 'provider', str),
+)
+
+
+def parse_raw_query_params(
+    request: Request, query_params: Iterable[RawQueryParam]
+) -> dict:
+    """
+    Parses query params with plain casts.
+    Raises RequestValidationError with all the errors, like FastAPI does.
+    """
+    values = {}
+    errors_ = []
+    for param in query_params:
+        loc = ('query', param.alias)
+        value = request.query_params.get(param.alias)
+        if value is None:
+            if param.required:
+                errors_.append(ErrorWrapper(errors.MissingError(), loc=loc))
+            values[param.name] = param.default
+            continue
+        try:
+            values[param.name] = param.cast(value)
+        except (TypeError, ValueError) as e:
+            errors_.append(ErrorWrapper(e, loc=loc))
+    if errors_:
+        raise RequestValidationError(errors_)
+    return values
+
+
+async def get_swap_price_raw(request: Request) -> ORJSONResponse:
+    """
+    Same as get_swap_price, but query params are parsed with plain casts
+    instead of FastAPI dependency resolution. Shares the cache with get_swap_price.
+    """
+    return await get_swap_price(
+        request=request,
+        chain_id=request.path_params['chain_id'],
+        **parse_raw_query_params(request, RAW_PRICE_QUERY_PARAMS),
+    )
+
+
+def raw_swap_routes(prefix: str) -> List[Route]:
+    """
+    Starlette routes for the hottest swap endpoints, which skip FastAPI request parsing.
+    Should be registered before swap_route, which is still used for OpenAPI docs.
+    """
+    return [
+        Route(
+            f'{prefix}/{{chain_id:int}}/price{slash}',
+            endpoint=get_swap_price_raw,
+            methods=['GET'],
+            include_in_schema=False,
+        )
+        for slash in ('', '/')
+    ]
 
 
 @swap_route.get(
-    '/{chain_id}/price/all', response_model=List[MetaPriceModel], responses=responses
+    '/{chain_id}/price/all',
+    responses=ALL_PRICES_RESPONSES,
+    description=ALL_PRICES_DESCRIPTION,
 )
 @swap_route.get(
     '/{chain_id}/price/all/',
     include_in_schema=False,
-    response_model=List[MetaPriceModel],
 )
 async def get_all_swap_prices(
+    request: Request,
     buy_token: address_to_lower = Query(..., alias='buyToken'),
     sell_token: address_to_lower = Query(..., alias='sellToken'),
-    sell_amount: conint(gt=0) = Query(..., alias='sellAmount'),
+    sell_amount: int = Query(..., gt=0, alias='sellAmount'),
     chain_id: int = Path(..., description='Chain ID'),
     gas_price: Optional[int] = Query(
         None, description='Gas price', gt=0, alias='gasPrice'
@@ -110,59 +321,47 @@ async def get_all_swap_prices(
     buy_token_percentage_fee: Optional[float] = Query(
         None, alias='buyTokenPercentageFee'
     ),
-    meta_aggregation_service: dependencies.MetaAggregationService = Depends(
-        dependencies.meta_aggregation_service
-    ),
-) -> List[MetaPriceModel]:
-    """
-    Works the same as /price endpoint, but returns all prices from all supported providers.
-
-    - **buy_token**: Address of the token to buy
-    - **sell_token**: Address of the token to sell
-    - **sell_amount**: Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
-    - **chain_id**: Chain ID. See /info for supported chains
-    - **gas_price**: Gas price in wei (optional)
-    - **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
-    - **taker_address**: Address of the taker (optional)
-    - **fee_recipient**: Address of the fee recipient (optional)
-    - **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
-    """
-    res = await meta_aggregation_service.get_swap_meta_price(
-        buy_token=buy_token,
-        sell_token=sell_token,
-        sell_amount=sell_amount,
-        chain_id=chain_id,
-        gas_price=gas_price,
-        slippage_percentage=slippage_percentage,
-        taker_address=taker_address,
-        fee_recipient=fee_recipient,
-        buy_token_percentage_fee=buy_token_percentage_fee,
+) -> ORJSONResponse:
+    meta_aggregation_service = dependencies.meta_aggregation_service(request)
+    params = {
+        "buy_token": buy_token,
+        "sell_token": sell_token,
+        "sell_amount": sell_amount,
+        "chain_id": chain_id,
+        "gas_price": gas_price,
+        "slippage_percentage": slippage_percentage,
+        "taker_address": taker_address,
+        "fee_recipient": fee_recipient,
+        "buy_token_percentage_fee": buy_token_percentage_fee,
+    }
+    content = await price_payloads(request).get_all_prices(
+        meta_aggregation_service, **params
     )
-    if not res:
+    if content is None:
         raise HTTPException(
             status_code=404,
             detail='No prices found',
         )
-    return res
+    return ORJSONResponse(content=content)
 
 
 @swap_route.get(
     '/{chain_id}/quote',
-    response_model=ProviderQuoteResponse,
-    responses=responses,
+    responses=QUOTE_RESPONSES,
+    description=QUOTE_DESCRIPTION,
     dependencies=[Depends(HTTPBearer())],
 )
 @swap_route.get(
     '/{chain_id}/quote/',
-    response_model=ProviderQuoteResponse,
     include_in_schema=False,
     dependencies=[Depends(HTTPBearer())],
 )
 async def get_swap_quote(
-    authorize: AuthJWT = Depends(),
+    request: Request,
+    authorize: CachedAuthJWT = Depends(),
     buy_token: address_to_lower = Query(..., alias='buyToken'),
     sell_token: address_to_lower = Query(..., alias='sellToken'),
-    sell_amount: conint(gt=0) = Query(..., alias='sellAmount'),
+    sell_amount: int = Query(..., gt=0, alias='sellAmount'),
     chain_id: int = Path(..., description='Chain ID'),
     provider: str = Query(..., alias='provider'),
     taker_address: address_to_lower = Query(..., alias='takerAddress'),
@@ -174,24 +373,8 @@ async def get_swap_quote(
     buy_token_percentage_fee: Optional[float] = Query(
         None, alias='buyTokenPercentageFee'
     ),
-    meta_aggregation_service: dependencies.MetaAggregationService = Depends(
-        dependencies.meta_aggregation_service
-    ),
-) -> ProviderQuoteResponse:
-    """
-    Returns a data for swap from a specific provider.
-
-    - **buy_token**:Address of the token to buy
-    - **sell_token**:Address of the token to sell
-    - **sell_amount**:Amount of the token to sell in base units (e.g. 1 ETH = 10**18)
-    - **chain_id**: Chain ID. See /info for supported chains
-    - **provider**: Provider name from /info
-    - **gas_price**: Gas price in wei (optional)
-    - **slippage_percentage**: Slippage percentage  (0.01 = 1%) (default: 0.005)
-    - **taker_address**: Address of the taker (optional)
-    - **fee_recipient**: Address of the fee recipient (optional)
-    - **buy_token_percentage_fee**: Percentage of the buy token fee (optional) (0.01 = 1%)
-    """
+) -> ORJSONResponse:
+    meta_aggregation_service = dependencies.meta_aggregation_service(request)
     authorize.jwt_required()
     quote = await meta_aggregation_service.get_meta_swap_quote(
         buy_token=buy_token,
@@ -205,4 +388,9 @@ async def get_swap_quote(
         fee_recipient=fee_recipient,
         buy_token_percentage_fee=buy_token_percentage_fee,
     )
-    return quote
+    if not quote:
+        raise HTTPException(
+            status_code=404,
+            detail='No quotes found',
+        )
+    return ORJSONResponse(content=quote.dict())
@@ -17,13 +17,21 @@ from meta_aggregation_api.models.meta_agg_models import (
     MetaPriceModel,
     ProviderPriceResponse,
     ProviderQuoteResponse,
+    SwapPrices,
+)
+from meta_aggregation_api.providers import (
+    BaseProvider,
+    CrossChainProvider,
+    ProviderRegistry,
 )
-from meta_aggregation_api.providers import ProviderRegistry, CrossChainProvider
 from meta_aggregation_api.services.chains import ChainsConfig
 from meta_aggregation_api.services.gas_service import GasService
 from meta_aggregation_api.utils.cache import get_cache_config
 from meta_aggregation_api.utils.common import get_web3_url
-from meta_aggregation_api.utils.errors import ProviderNotFound
+from meta_aggregation_api.utils.errors import (
+    BaseAggregationProviderError,
+    ProviderNotFound,
+)
 from meta_aggregation_api.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -60,7 +68,6 @@ class MetaAggregationService:
         self.get_decimals_for_native_and_buy_token = cached_(60 * 60 * 2, noself=True)(
             self.get_decimals_for_native_and_buy_token
         )
-        self.get_swap_meta_price = cached_(ttl=5, noself=True)(self.get_swap_meta_price)
 
     async def get_token_allowance(
         self,
@@ -118,25 +125,31 @@ class MetaAggregationService:
         Returns:
             dict: Returns a dictionary with provider names as keys and approve costs as values
         """
-        approve_costs_per_provider = {}
-        for provider in providers_:
-            if not taker_address:
-                approve_costs_per_provider[provider['name']] = 0
-                continue
-            spender_address = provider['address']
+        if not taker_address:
+            return {provider['name']: 0 for provider in providers_}
+
+        async def get_approve_cost_for_provider(spender_address: str) -> int:
             allowance = await self.get_token_allowance(
                 sell_token, spender_address, erc20_contract, taker_address
             )
             logger.debug('Got allowance for token %s: %s', sell_token, allowance)
-            if allowance < sell_amount:
-                logger.debug('Allowance is not enough, getting approve cost')
-                approve_cost = await self.get_approve_cost(
-                    taker_address, spender_address, erc20_contract
-                )
-                approve_costs_per_provider[provider['name']] = approve_cost
-            else:
-                approve_costs_per_provider[provider['name']] = 0
-        return approve_costs_per_provider
+            if allowance >= sell_amount:
+                return 0
+            logger.debug('Allowance is not enough, getting approve cost')
+            return await self.get_approve_cost(
+                taker_address, spender_address, erc20_contract
+            )
+
+        approve_costs = await asyncio.gather(
+            *(
+                get_approve_cost_for_provider(provider['address'])
+                for provider in providers_
+            )
+        )
+        return {
+            provider['name']: approve_cost
+            for provider, approve_cost in zip(providers_, approve_costs)
+        }
 
     async def get_swap_meta_price(
         self,
@@ -175,6 +188,92 @@ class MetaAggregationService:
                 is_best:bool: The best price_response for the swap
 
         """
+        swap_prices = await self.get_swap_prices(
+            buy_token,
+            sell_token,
+            sell_amount,
+            chain_id,
+            gas_price,
+            slippage_percentage,
+            taker_address,
+            fee_recipient,
+            buy_token_percentage_fee,
+        )
+        return swap_prices.quotes()
+
+    async def get_best_swap_meta_price(
+        self,
+        buy_token: str,
+        sell_token: str,
+        sell_amount: int,
+        chain_id: int,
+        gas_price: Optional[int] = None,
+        slippage_percentage: Optional[float] = None,
+        taker_address: Optional[str] = None,
+        fee_recipient: Optional[str] = None,
+        buy_token_percentage_fee: Optional[float] = None,
+    ) -> Optional[MetaPriceModel]:
+        """
+        Works in the same way as get_swap_meta_price, but returns only the best price.
+        Models for the other providers are not built.
+
+        Args:
+            buy_token:str: Specify the token address that you want to buy
+            sell_token:str: Specify the token address that is sold in the swap
+            sell_amount:int: Specify the amount of tokens to sell in base units (e.g. 1 ETH = 10 ** 18)
+            taker_address:str: Specify the address of the user who will be using this price_response
+            chain_id:int: Specify the chain on which to perform the swap
+            gas_price:Optional[int]=None: Set the gas price for the transaction. If not set, the gas price will be fetched web3
+            slippage_percentage:Optional[float]=None: Set a maximum percentage of slippage for the trade. (0.01 = 1%)
+            fee_recipient:Optional[str]=None: Specify the address of a fee recipient
+            buy_token_percentage_fee:Optional[float]=None: Specify a percentage of the buy_amount that will be used to pay fees
+
+        Returns:
+            MetaPriceModel object of the best provider with is_best=True or None if no prices found
+        """
+        swap_prices = await self.get_swap_prices(
+            buy_token,
+            sell_token,
+            sell_amount,
+            chain_id,
+            gas_price,
+            slippage_percentage,
+            taker_address,
+            fee_recipient,
+            buy_token_percentage_fee,
+        )
+        return swap_prices.best_quote()
+
+    async def get_swap_prices(
+        self,
+        buy_token: str,
+        sell_token: str,
+        sell_amount: int,
+        chain_id: int,
+        gas_price: Optional[int] = None,
+        slippage_percentage: Optional[float] = None,
+        taker_address: Optional[str] = None,
+        fee_recipient: Optional[str] = None,
+        buy_token_percentage_fee: Optional[float] = None,
+    ) -> SwapPrices:
+        """
+        Get swap prices from all providers, approve costs for them and choose the best provider.
+
+        Args:
+            buy_token:str: Specify the token address that you want to buy
+            sell_token:str: Specify the token address that is sold in the swap
+            sell_amount:int: Specify the amount of tokens to sell in base units (e.g. 1 ETH = 10 ** 18)
+            taker_address:str: Specify the address of the user who will be using this price_response
+            chain_id:int: Specify the chain on which to perform the swap
+            gas_price:Optional[int]=None: Set the gas price for the transaction. If not set, the gas price will be fetched web3
+            slippage_percentage:Optional[float]=None: Set a maximum percentage of slippage for the trade. (0.01 = 1%)
+            fee_recipient:Optional[str]=None: Specify the address of a fee recipient
+            buy_token_percentage_fee:Optional[float]=None: Specify a percentage of the buy_amount that will be used to pay fees
+
+        Returns:
+            SwapPrices object with the best provider name, prices and approve costs by provider names.
+            If no prices found, the best provider is None and both dicts are empty.
+        """
         spender_addresses = self.providers.get_providers_on_chain(chain_id)[
             'market_order'
         ]
@@ -198,9 +297,7 @@ class MetaAggregationService:
         if buy_token == self.config.NATIVE_TOKEN_ADDRESS:
             buy_token = self.chains.get_chain_by_id(chain_id).native_token.address
         get_buy_token_price_task = asyncio.create_task(
-            DexGuru(
-                self.config.PUBLIC_KEY, domain=self.config.PUBLIC_API_DOMAIN
-            ).get_token_finance(chain_id, buy_token)
+            self.guru_sdk.get_token_finance(chain_id, buy_token)
         )
         if not gas_price:
             gas_price = await self.gas_service.get_base_gas_price(chain_id)
@@ -214,41 +311,33 @@ class MetaAggregationService:
             provider_instance = self.provider_registry.get(provider_name)
             if not provider_instance:
                 continue
-            src_decimals, dest_decimals = 0, 0
-            if provider_name == 'paraswap':
-                if sell_token == self.config.NATIVE_TOKEN_ADDRESS:
-                    src_decimals = self.chains.get_chain_by_id(chain_id).native_token.decimals
-                else:
-                    src_inv = await self.guru_sdk.get_token_inventory_by_address(
-                        chain_id, sell_token
-                    )
-                    src_decimals = src_inv.decimals
-                if buy_token == self.config.NATIVE_TOKEN_ADDRESS:
-                    dest_decimals = self.chains.get_chain_by_id(chain_id).native_token.decimals
-                else:
-                    dest_inv = await self.guru_sdk.get_token_inventory_by_address(
-                        chain_id, buy_token
-                    )
-                    dest_decimals = dest_inv.decimals
-
             prices_tasks.append(
                 asyncio.create_task(
-                    provider_instance.get_swap_price(
-                        buy_token,
-                        sell_token,
-                        sell_amount,
-                        chain_id,
-                        gas_price,
-                        slippage_percentage,
-                        taker_address,
-                        fee_recipient,
-                        buy_token_percentage_fee,
-                        src_decimals=src_decimals,
-                        dest_decimals=dest_decimals,
+                    self._get_provider_swap_price(
+                        provider_instance,
+                        buy_token=buy_token,
+                        sell_token=sell_token,
+                        sell_amount=sell_amount,
+                        chain_id=chain_id,
+                        gas_price=gas_price,
+                        slippage_percentage=slippage_percentage,
+                        taker_address=taker_address,
+                        fee_recipient=fee_recipient,
+                        buy_token_percentage_fee=buy_token_percentage_fee,
                     )
                 )
             )
         prices_list = await asyncio.gather(*prices_tasks, return_exceptions=True)
+        for price in prices_list:
+            # provider errors are already logged by the providers themselves
+            if isinstance(price, BaseException) and not isinstance(
+                price, BaseAggregationProviderError
+            ):
+                logger.error(
+                    'Unexpected error while getting swap price',
+                    exc_info=price,
+                    extra={'chain_id': chain_id},
+                )
         prices = {
             price.provider: price
             for price in prices_list
@@ -265,12 +354,12 @@ class MetaAggregationService:
                     'providers': list(prices.keys()),
                 },
             )
-            return []
+            return SwapPrices()
         approve_costs = await approve_costs
         native_decimals, buy_token_decimals = await get_decimals_task
         buy_token_price = await get_buy_token_price_task
         buy_token_price = buy_token_price.price_eth
-        best_provider, price = self.choose_best_provider(
+        best_provider, _ = self.choose_best_provider(
             prices, approve_costs, native_decimals, buy_token_decimals, buy_token_price
         )
         logger.info(
@@ -283,16 +372,60 @@ class MetaAggregationService:
                 'taker_address': taker_address,
             },
         )
-        return [
-            MetaPriceModel(
-                provider=provider_,
-                is_allowed=approve_costs[provider_] == 0,
-                price_response=price_,
-                is_best=provider_ == best_provider,
-                approve_cost=approve_costs[provider_],
+        return SwapPrices.construct(
+            best_provider=best_provider, prices=prices, approve_costs=approve_costs
+        )
+
+    async def get_src_dest_decimals(
+        self, chain_id: int, sell_token: str, buy_token: str
+    ) -> Tuple[int, int]:
+        """
+        Get decimals for sell token and buy token. Both are requested concurrently.
+        Some providers (e.g. paraswap) require decimals of the tokens in swap request.
+
+        Args:
+            chain_id:int: Specify the chain that is being queried
+            sell_token:str: Address of the token that is being sold
+            buy_token:str: Address of the token that is being bought
+
+        Returns:
+            Tuple of decimals for the sell token and the buy token
+        """
+
+        async def get_decimals(token: str) -> int:
+            if token == self.config.NATIVE_TOKEN_ADDRESS:
+                return self.chains.get_chain_by_id(chain_id).native_token.decimals
+            inventory = await self.guru_sdk.get_token_inventory_by_address(
+                chain_id, token
+            )
+            return inventory.decimals
+
+        src_decimals, dest_decimals = await asyncio.gather(
+            get_decimals(sell_token), get_decimals(buy_token)
+        )
+        return src_decimals, dest_decimals
+
+    async def _get_provider_swap_price(
+        self,
+        provider_instance: BaseProvider,
+        buy_token: str,
+        sell_token: str,
+        chain_id: int,
+        **kwargs,
+    ) -> ProviderPriceResponse:
+        src_decimals, dest_decimals = 0, 0
+        if provider_instance.PROVIDER_NAME == 'paraswap':
+            src_decimals, dest_decimals = await self.get_src_dest_decimals(
+                chain_id, sell_token, buy_token
             )
-            for provider_, price_ in prices.items()
-        ]
+        return await provider_instance.get_swap_price(
+            buy_token=buy_token,
+            sell_token=sell_token,
+            chain_id=chain_id,
+            src_decimals=src_decimals,
+            dest_decimals=dest_decimals,
+            **kwargs,
+        )
 
     async def get_decimals_for_native_and_buy_token(
         self, chain_id: int, buy_token: str
@@ -507,25 +640,6 @@ class MetaAggregationService:
         provider_instance = self.provider_registry.get(provider)
         if not provider_instance:
             raise ProviderNotFound(provider)
-        src_decimals, dest_decimals = 0, 0
-        if provider == 'paraswap':
-            if sell_token == self.config.NATIVE_TOKEN_ADDRESS:
-                src_decimals = self.chains.get_chain_by_id(
-                    chain_id).native_token.decimals
-            else:
-                src_inv = await self.guru_sdk.get_token_inventory_by_address(
-                    chain_id, sell_token
-                )
-                src_decimals = src_inv.decimals
-            if buy_token == self.config.NATIVE_TOKEN_ADDRESS:
-                dest_decimals = self.chains.get_chain_by_id(
-                    chain_id).native_token.decimals
-            else:
-                dest_inv = await self.guru_sdk.get_token_inventory_by_address(
-                    chain_id, buy_token
-                )
-                dest_decimals = dest_inv.decimals
-
         spender_address = next(
             (
                 spender['address']
@@ -558,7 +672,8 @@ class MetaAggregationService:
         gas_price = (
             await gas_price if isinstance(gas_price, asyncio.Task) else gas_price
         )
-        price = await provider_instance.get_swap_price(
+        price = await self._get_provider_swap_price(
+            provider_instance,
             buy_token=buy_token,
             sell_token=sell_token,
             sell_amount=sell_amount,
@@ -568,10 +683,8 @@ class MetaAggregationService:
             taker_address=taker_address,
             fee_recipient=fee_recipient,
             buy_token_percentage_fee=buy_token_percentage_fee,
-            src_decimals=src_decimals,
-            dest_decimals=dest_decimals,
         )
-        return MetaPriceModel(
+        return MetaPriceModel.construct(
             provider=provider,
             price_response=price,
             is_allowed=bool(allowance),
@@ -735,7 +848,7 @@ class MetaAggregationService:
                 erc20_contract=erc20_contract,
             )
 
-        return MetaPriceModel(
+        return MetaPriceModel.construct(
             provider=provider,
             price_response=price,
             is_allowed=bool(allowance),
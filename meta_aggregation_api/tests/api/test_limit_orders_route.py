@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from meta_aggregation_api.rest_api import dependencies
+
+TRADER = '0x61e1a8041186ceb8a561f6f264e8b2bb2e20e06d'
+
+
+@pytest.fixture()
+def limit_orders_service_mock(trading_client) -> Mock:
+    service = Mock(get_by_wallet_address=AsyncMock(return_value=[]))
+    app = trading_client.app
+    app.dependency_overrides[dependencies.limit_orders_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+def test_get_orders_by_trader(trading_client, limit_orders_service_mock):
+    response = trading_client.get(
+        f'v1/limit/1/address/{TRADER.upper().replace("0X", "0x")}',
+        params={'provider': 'zero_x'},
+    )
+    assert response.status_code == 200
+    call_kwargs = limit_orders_service_mock.get_by_wallet_address.await_args.kwargs
+    assert call_kwargs['trader'] == TRADER
+
+
+@pytest.mark.parametrize(
+    'trader, params',
+    (
+        ('0x123', {'provider': 'zero_x'}),
+        (f'{TRADER}0', {'provider': 'zero_x'}),
+        (TRADER, {'provider': 'zero_x', 'maker_token': f'token {TRADER}'}),
+    ),
+)
+def test_get_orders_by_trader_invalid_address(
+    trader, params, trading_client, limit_orders_service_mock
+):
+    response = trading_client.get(f'v1/limit/1/address/{trader}', params=params)
+    assert response.status_code == 422
+    limit_orders_service_mock.get_by_wallet_address.assert_not_awaited()
+
+
+def test_address_schema_pattern_is_anchored(trading_client):
+    schema = trading_client.get('openapi.json').json()
+    parameters = schema['paths']['/v1/limit/{chain_id}/address/{trader}']['get'][
+        'parameters'
+    ]
+    trader = next(param for param in parameters if param['name'] == 'trader')
+    assert trader['schema']['pattern'] == '^0x[0-9a-fA-F]{40}$'
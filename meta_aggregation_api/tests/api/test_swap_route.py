@@ -0,0 +1,313 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from aiocache import SimpleMemoryCache
+from starlette.testclient import TestClient
+
+from meta_aggregation_api.config.auth import CachedAuthJWT
+from meta_aggregation_api.models.meta_agg_models import (
+    MetaPriceModel,
+    ProviderPriceResponse,
+    ProviderQuoteResponse,
+)
+from meta_aggregation_api.rest_api.create_app import create_app
+from meta_aggregation_api.rest_api.routes.swap import (
+    RAW_PRICE_QUERY_PARAMS,
+    get_swap_price,
+)
+
+BUY_TOKEN = '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48'
+SELL_TOKEN = '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2'
+
+
+def make_price(provider: str, is_best: bool) -> MetaPriceModel:
+    return MetaPriceModel(
+        provider=provider,
+        price_response=ProviderPriceResponse(
+            provider=provider,
+            sources=[],
+            buy_amount='10',
+            gas='1',
+            sell_amount='1',
+            gas_price='1',
+            value='0',
+            price='10',
+        ),
+        is_allowed=True,
+        is_best=is_best,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    def clear():
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(SimpleMemoryCache().clear())
+        loop.close()
+        CachedAuthJWT.clear_verified_tokens()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture()
+def meta_agg_service_mock(trading_client) -> Mock:
+    service = Mock()
+    service.get_swap_meta_price = AsyncMock(
+        return_value=[make_price('zero_x', False), make_price('one_inch', True)]
+    )
+    service.get_best_swap_meta_price = AsyncMock(
+        return_value=make_price('one_inch', True)
+    )
+    app = trading_client.app
+    app_dependencies = app.state.dependencies
+    app.state.dependencies = Mock(meta_aggregation_service=service)
+    yield service
+    app.state.dependencies = app_dependencies
+
+
+def test_get_swap_price_is_cached(trading_client, meta_agg_service_mock):
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    for _ in range(2):
+        response = trading_client.get('v1/market/1/price', params=params)
+        assert response.status_code == 200
+        assert response.json()['provider'] == 'one_inch'
+    assert meta_agg_service_mock.get_best_swap_meta_price.await_count == 1
+
+    params['takerAddress'] = '0x61e1a8041186ceb8a561f6f264e8b2bb2e20e06d'
+    response = trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 200
+    assert meta_agg_service_mock.get_best_swap_meta_price.await_count == 2
+
+
+def test_price_cache_is_built_once(trading_client, meta_agg_service_mock):
+    price_payloads = trading_client.app.state.price_payloads
+    cache = price_payloads.get_price.cache
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    with patch.object(cache, 'get', wraps=cache.get) as cache_get_mock:
+        for _ in range(2):
+            response = trading_client.get('v1/market/1/price', params=params)
+            assert response.status_code == 200
+            assert trading_client.app.state.price_payloads is price_payloads
+            assert price_payloads.get_price.cache is cache
+    assert cache_get_mock.await_count == 2
+    assert meta_agg_service_mock.get_best_swap_meta_price.await_count == 1
+
+
+def test_get_all_swap_prices_is_cached(trading_client, meta_agg_service_mock):
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    for _ in range(2):
+        response = trading_client.get('v1/market/1/price/all', params=params)
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+    assert meta_agg_service_mock.get_swap_meta_price.await_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_get_all_swap_prices_coalesced_gzip(
+    trading_client, meta_agg_service_mock
+):
+    prices = [make_price(f'provider_{i}', i == 0) for i in range(20)]
+
+    async def get_swap_meta_price(**kwargs):
+        await asyncio.sleep(0.01)
+        return prices
+
+    meta_agg_service_mock.get_swap_meta_price.side_effect = get_swap_meta_price
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    async with httpx.AsyncClient(
+        app=trading_client.app, base_url='http://test'
+    ) as client:
+        responses = await asyncio.gather(
+            *(
+                client.get(
+                    '/v1/market/1/price/all',
+                    params=params,
+                    headers={'Accept-Encoding': 'gzip'},
+                )
+                for _ in range(3)
+            )
+        )
+    assert meta_agg_service_mock.get_swap_meta_price.await_count == 1
+    for response in responses:
+        assert response.status_code == 200
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.json() == [price.dict() for price in prices]
+
+
+def test_swap_routes_skip_response_validation(trading_client):
+    swap_routes = [
+        route
+        for route in trading_client.app.routes
+        if route.path.startswith('/v1/market/')
+    ]
+    assert swap_routes
+    for route in swap_routes:
+        assert route.response_field is None
+
+
+@pytest.mark.parametrize('buy_token', ('test_token', '0x123', BUY_TOKEN + '0'))
+def test_get_swap_price_invalid_address(
+    buy_token, trading_client, meta_agg_service_mock
+):
+    params = {'buyToken': buy_token, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    response = trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 422
+    meta_agg_service_mock.get_best_swap_meta_price.assert_not_awaited()
+
+
+def test_get_swap_price_address_to_lower(trading_client, meta_agg_service_mock):
+    params = {
+        'buyToken': f' {BUY_TOKEN.upper().replace("0X", "0x")} ',
+        'sellToken': SELL_TOKEN,
+        'sellAmount': 100,
+    }
+    response = trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 200
+    call_kwargs = meta_agg_service_mock.get_best_swap_meta_price.await_args.kwargs
+    assert call_kwargs['buy_token'] == BUY_TOKEN
+
+
+@pytest.mark.parametrize('sell_amount', (0, -1, 'test'))
+def test_get_swap_price_invalid_sell_amount(
+    sell_amount, trading_client, meta_agg_service_mock
+):
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': sell_amount}
+    response = trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 422
+    meta_agg_service_mock.get_best_swap_meta_price.assert_not_awaited()
+
+
+def test_get_swap_quote_jwt_is_verified_once(trading_client, meta_agg_service_mock):
+    meta_agg_service_mock.get_meta_swap_quote = AsyncMock(
+        return_value=ProviderQuoteResponse(
+            sources=[],
+            buy_amount='10',
+            gas='1',
+            sell_amount='1',
+            to=SELL_TOKEN,
+            data='0x',
+            gas_price='1',
+            value='0',
+            price='10',
+        )
+    )
+    token = CachedAuthJWT().create_access_token(subject='test_quote')
+    params = {
+        'buyToken': BUY_TOKEN,
+        'sellToken': SELL_TOKEN,
+        'sellAmount': 100,
+        'provider': 'zero_x',
+        'takerAddress': '0x61e1a8041186ceb8a561f6f264e8b2bb2e20e06d',
+    }
+    with patch.object(
+        CachedAuthJWT,
+        '_verify_jwt_in_request',
+        autospec=True,
+        side_effect=CachedAuthJWT._verify_jwt_in_request,
+    ) as verify_mock:
+        for _ in range(2):
+            response = trading_client.get(
+                'v1/market/1/quote',
+                params=params,
+                headers={'Authorization': f'Bearer {token}'},
+            )
+            assert response.status_code == 200
+            assert response.json()['data'] == '0x'
+        assert verify_mock.call_count == 1
+
+        response = trading_client.get(
+            'v1/market/1/quote',
+            params=params,
+            headers={'Authorization': f'Bearer {token}invalid'},
+        )
+        assert response.status_code == 422
+        assert verify_mock.call_count == 2
+
+
+def test_get_all_swap_prices_response(trading_client, meta_agg_service_mock):
+    params = {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 100}
+    response = trading_client.get('v1/market/1/price/all', params=params)
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == [
+        quote.dict()
+        for quote in meta_agg_service_mock.get_swap_meta_price.return_value
+    ]
+
+
+@pytest.fixture()
+def raw_trading_client(config, meta_agg_service_mock) -> TestClient:
+    app = create_app(config=config.copy(update={'RAW_SWAP_ROUTES': True}))
+    app.state.dependencies = Mock(meta_aggregation_service=meta_agg_service_mock)
+    return TestClient(app)
+
+
+def test_get_swap_price_raw_route(raw_trading_client, meta_agg_service_mock):
+    params = {
+        'buyToken': f' {BUY_TOKEN.upper().replace("0X", "0x")} ',
+        'sellToken': SELL_TOKEN,
+        'sellAmount': 100,
+        'gasPrice': 10,
+    }
+    response = raw_trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 200
+    best_price = meta_agg_service_mock.get_best_swap_meta_price.return_value
+    assert response.json() == best_price.dict()
+    call_kwargs = meta_agg_service_mock.get_best_swap_meta_price.await_args.kwargs
+    assert call_kwargs['buy_token'] == BUY_TOKEN
+    assert call_kwargs['sell_amount'] == 100
+    assert call_kwargs['chain_id'] == 1
+    assert call_kwargs['gas_price'] == 10
+    assert call_kwargs['slippage_percentage'] == 0.005
+
+    response = raw_trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 200
+    assert meta_agg_service_mock.get_best_swap_meta_price.await_count == 1
+
+
+@pytest.mark.parametrize(
+    'params',
+    (
+        {'buyToken': 'test_token', 'sellToken': SELL_TOKEN, 'sellAmount': 100},
+        {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 0},
+        {'buyToken': BUY_TOKEN, 'sellToken': SELL_TOKEN, 'sellAmount': 'test'},
+        {'buyToken': BUY_TOKEN, 'sellAmount': 100},
+        {
+            'buyToken': BUY_TOKEN,
+            'sellToken': SELL_TOKEN,
+            'sellAmount': 100,
+            'gasPrice': 0,
+            'slippagePercentage': 'test',
+            'takerAddress': '0x123',
+        },
+        {},
+    ),
+)
+def test_get_swap_price_raw_route_invalid_params(
+    params, trading_client, raw_trading_client, meta_agg_service_mock
+):
+    response = raw_trading_client.get('v1/market/1/price', params=params)
+    assert response.status_code == 422
+    meta_agg_service_mock.get_best_swap_meta_price.assert_not_awaited()
+    fastapi_response = trading_client.get('v1/market/1/price', params=params)
+    assert fastapi_response.status_code == 422
+    assert response.json() == fastapi_response.json()
+
+
+def test_raw_price_query_params_match_fastapi_route(trading_client):
+    route = next(
+        route
+        for route in trading_client.app.routes
+        if getattr(route, 'endpoint', None) is get_swap_price
+    )
+    assert [
+        (field.name, field.alias, field.required, field.default)
+        for field in route.dependant.query_params
+    ] == [
+        (param.name, param.alias, param.required, param.default)
+        for param in RAW_PRICE_QUERY_PARAMS
+    ]
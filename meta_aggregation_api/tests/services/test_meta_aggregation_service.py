@@ -7,7 +7,10 @@ from web3 import Web3
 
 from meta_aggregation_api.config import Config
 from meta_aggregation_api.config.providers import ProvidersConfig
-from meta_aggregation_api.models.meta_agg_models import ProviderPriceResponse
+from meta_aggregation_api.models.meta_agg_models import (
+    ProviderPriceResponse,
+    SwapPrices,
+)
 from meta_aggregation_api.services.meta_aggregation_service import (
     MetaAggregationService,
 )
@@ -164,6 +167,44 @@ async def test_get_swap_meta_price_no_price(
     assert res == []
 
 
+@pytest.mark.asyncio()
+async def test_get_best_swap_meta_price(meta_agg_service: MetaAggregationService):
+    prices = {
+        provider: ProviderPriceResponse(
+            provider=provider,
+            sources=[],
+            buy_amount=1,
+            gas=1,
+            gas_price=1,
+            value=1,
+            price=1,
+            sell_amount=1,
+        )
+        for provider in ('provider_1', 'provider_2')
+    }
+    approve_costs = {'provider_1': 0, 'provider_2': 10}
+    with patch.object(
+        meta_agg_service, 'get_swap_prices', new_callable=AsyncMock
+    ) as get_swap_prices_mock:
+        get_swap_prices_mock.return_value = SwapPrices(
+            best_provider='provider_2', prices=prices, approve_costs=approve_costs
+        )
+        res = await meta_agg_service.get_best_swap_meta_price(
+            'buy_token', 'sell_token', 1, 1
+        )
+        assert res.provider == 'provider_2'
+        assert res.price_response == prices['provider_2']
+        assert res.is_best is True
+        assert res.is_allowed is False
+        assert res.approve_cost == 10
+
+        get_swap_prices_mock.return_value = SwapPrices()
+        res = await meta_agg_service.get_best_swap_meta_price(
+            'buy_token', 'sell_token', 1, 1
+        )
+        assert res is None
+
+
 @pytest.mark.asyncio()
 @patch(
     'meta_aggregation_api.services.meta_aggregation_service.DexGuru.get_token_inventory_by_address',
@@ -189,6 +230,26 @@ async def test_get_decimals_for_native_and_buy_token_call_count(
     assert get_token_mock.call_count == call_count
 
 
+@pytest.mark.asyncio()
+@patch(
+    'meta_aggregation_api.services.meta_aggregation_service.DexGuru.get_token_inventory_by_address',
+    new_callable=AsyncMock,
+)
+async def test_get_src_dest_decimals(
+    get_token_mock: AsyncMock,
+    config,
+    meta_agg_service: MetaAggregationService,
+):
+    get_token_mock.return_value = Mock(decimals=6)
+    res = await meta_agg_service.get_src_dest_decimals(
+        1, config.NATIVE_TOKEN_ADDRESS, '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48'
+    )
+    assert res == (18, 6)
+    get_token_mock.assert_awaited_once_with(
+        1, '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48'
+    )
+
+
 @pytest.mark.parametrize(
     'buy_amount_1__gas_1__gas_price_1__approve_cost_1,buy_amount_2__gas_2__gas_price_2__approve_cost_2,expected_provider',
     (
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from meta_aggregation_api.utils.cache import coalesce_calls, key_from_kwargs
+
+
+@pytest.mark.asyncio()
+async def test_coalesce_calls():
+    calls = []
+
+    @coalesce_calls(key_builder=key_from_kwargs('value'))
+    async def func(value: int, request_id: int) -> int:
+        calls.append(request_id)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    res = await asyncio.gather(
+        func(value=1, request_id=1),
+        func(value=1, request_id=2),
+        func(value=2, request_id=3),
+    )
+    assert res == [2, 2, 4]
+    assert calls == [1, 3]
+
+    assert await func(value=1, request_id=4) == 2
+    assert calls == [1, 3, 4]
+
+
+@pytest.mark.asyncio()
+async def test_coalesce_calls_exception():
+    calls = 0
+
+    @coalesce_calls(key_builder=key_from_kwargs('value'))
+    async def func(value: int) -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError(value)
+
+    res = await asyncio.gather(func(value=1), func(value=1), return_exceptions=True)
+    assert [type(exc) for exc in res] == [ValueError, ValueError]
+    assert calls == 1
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from enum import Enum
 from hashlib import md5
 
@@ -38,6 +40,24 @@ def key_from_args(func, *args, **kwargs):
     return md5_hash
 
 
+def key_from_kwargs(*names: str):
+    """
+    Returns key builder which uses only listed keyword arguments of the call.
+    FastAPI passes all the handler parameters (including dependencies) as kwargs,
+    so routes should pick the query parameters that affect the response explicitly.
+    """
+
+    def key_builder(func, *args, **kwargs):
+        key = (
+            (func.__module__ or "")
+            + func.__name__
+            + str([kwargs.get(name) for name in names])
+        )
+        return md5(key.encode()).digest()
+
+    return key_builder
+
+
 def get_cache_config(config: CacheConfig) -> dict:
     cache_config_common_redis = {
         'cache': Cache.REDIS,
@@ -60,3 +80,28 @@ def get_cache_config(config: CacheConfig) -> dict:
     }
 
     return cache_config[config.CACHE]
+
+
+def coalesce_calls(key_builder=key_from_args):
+    """
+    Makes concurrent calls with the same key share a single execution of the function.
+    Complements cached decorator, which helps only after the first call has finished.
+    The shared task is shielded, so a cancelled caller doesn't cancel it for the others.
+    """
+
+    def decorator(func):
+        in_flight: dict[bytes, asyncio.Task] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_builder(func, *args, **kwargs)
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(lambda _: in_flight.pop(key, None))
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
@@ -1,8 +1,6 @@
 import re
 from urllib.parse import urljoin
 
-from pydantic import constr
-
 from meta_aggregation_api.config import Config
 
 
@@ -21,6 +19,28 @@ def get_web3_url(chain_id: int, config: Config):
     return urljoin(config.PUBLIC_API_DOMAIN, f'rpc/{chain_id}/{config.PUBLIC_KEY}')
 
 
-address_to_lower = constr(
-    strip_whitespace=True, to_lower=True
-)
+ADDRESS_REGEX = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+
+class address_to_lower(str):
+    """
+    EVM address, normalized to lower case.
+    Validated with a single precompiled regex instead of constr validators chain.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict):
+        field_schema.update(pattern=ADDRESS_REGEX.pattern)
+
+    @classmethod
+    def validate(cls, value) -> str:
+        if not isinstance(value, str):
+            raise TypeError('string required')
+        value = value.strip()
+        if not ADDRESS_REGEX.fullmatch(value):
+            raise ValueError('invalid address')
+        return value.lower()